@@ -0,0 +1,129 @@
+"""
+양자화 인덱스의 재현율(recall) 대비 메모리 사용량을 합성 데이터로 측정하는 벤치마크입니다.
+ChromaDB나 API 키 없이 실행할 수 있습니다.
+
+사용법: python -m benchmarks.quantization_benchmark --n 20000 --queries 200
+"""
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+
+from memory_system.quantization import QuantizedIndex, rerank_exact
+
+# models/embedding-001의 임베딩 차원
+EMBEDDING_DIM = 768
+# 점진적 추가 경로에서 한 번에 add할 벡터 수 (봇은 하나씩 추가하지만 벤치마크 시간을 줄이기 위해 묶음)
+ADD_BATCH = 100
+
+
+def make_corpus(n: int, dim: int, rank: int, seed: int) -> np.ndarray:
+    """실제 문장 임베딩처럼 소수의 방향에 분산이 몰린 합성 벡터를 생성합니다."""
+    rng = np.random.default_rng(seed)
+    basis = rng.standard_normal((rank, dim)).astype(np.float32)
+    weights = rng.standard_normal((n, rank)).astype(np.float32) / np.sqrt(np.arange(1, rank + 1))
+    vectors = weights @ basis + 0.05 * rng.standard_normal((n, dim)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def exact_top_k(corpus: np.ndarray, query: np.ndarray, k: int) -> np.ndarray:
+    distances = ((corpus - query) ** 2).sum(axis=1)
+    return np.argsort(distances)[:k]
+
+
+def build_incremental(index: QuantizedIndex, ids: list, corpus: np.ndarray) -> int:
+    """
+    VectorStore.add_memory처럼 빈 인덱스에 벡터를 추가하고, needs_refit이면
+    지금까지 추가된 원본 벡터 전체로 다시 build합니다. 재학습 횟수를 반환합니다.
+    """
+    index.build([], [])
+    refits = 0
+    for start in range(0, len(ids), ADD_BATCH):
+        end = start + ADD_BATCH
+        index.add(ids[start:end], corpus[start:end])
+        if index.needs_refit:
+            index.build(ids[:end], corpus[:end])
+            refits += 1
+    return refits
+
+
+def run(index: QuantizedIndex, corpus: np.ndarray, queries: np.ndarray, k: int, rerank_factor: int,
+        incremental: bool = False):
+    ids = [str(i) for i in range(len(corpus))]
+    if incremental:
+        build_incremental(index, ids, corpus)
+    else:
+        index.build(ids, corpus)
+
+    hits_first, hits_rerank, elapsed = 0, 0, 0.0
+    for query in queries:
+        truth = {str(i) for i in exact_top_k(corpus, query, k)}
+
+        start = time.perf_counter()
+        candidates = index.search(query, k * rerank_factor)
+        elapsed += time.perf_counter() - start
+
+        candidate_vectors = corpus[[int(c) for c in candidates]]
+        reranked = rerank_exact(query, candidates, candidate_vectors, k)
+
+        hits_first += len(truth & set(candidates[:k]))
+        hits_rerank += len(truth & set(reranked))
+
+    # 검색 한 번에 추가로 할당되는 최대 메모리 (시간 측정과 분리하여 한 쿼리로만 측정)
+    tracemalloc.start()
+    index.search(queries[0], k * rerank_factor)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    total = k * len(queries)
+    return hits_first / total, hits_rerank / total, index.nbytes, peak, elapsed / len(queries) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--n", type=int, default=20000, help="코퍼스 벡터 수")
+    parser.add_argument("--queries", type=int, default=200, help="쿼리 수")
+    parser.add_argument("--k", type=int, default=10, help="recall@k의 k")
+    parser.add_argument("--rerank-factor", type=int, default=4, help="재정렬 후보 수 = k * rerank_factor")
+    parser.add_argument("--rank", type=int, default=400,
+                        help="합성 코퍼스의 내재 차원 (실제 문장 임베딩처럼 수백 차원에 분산이 퍼지도록)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    corpus = make_corpus(args.n, EMBEDDING_DIM, rank=args.rank, seed=args.seed)
+    # 쿼리는 코퍼스 벡터에 약간의 잡음을 섞어 만듭니다.
+    rng = np.random.default_rng(args.seed + 1)
+    queries = corpus[rng.choice(args.n, args.queries, replace=False)]
+    queries = queries + 0.05 * rng.standard_normal(queries.shape).astype(np.float32)
+
+    # (형식, 차원, 축소 방식, 점진적 추가 여부)
+    # 'truncate' 축소는 Matryoshka 방식으로 학습된 모델에서만 의미가 있습니다.
+    # models/embedding-001은 해당하지 않으므로 기본 비교 대상에서 제외합니다.
+    configs = [
+        ("float32", None, "truncate", False),
+        ("float16", None, "truncate", False),
+        ("int8", None, "truncate", False),
+        ("int8", 256, "pca", False),
+        ("int8", 128, "pca", False),
+        ("int8", 128, "pca", True),
+        ("int8", 64, "pca", False),
+    ]
+
+    print(f"코퍼스 {args.n}개 x {EMBEDDING_DIM}차원 (내재 차원 {args.rank}), 쿼리 {args.queries}개, "
+          f"recall@{args.k}, 재정렬 후보 {args.k * args.rerank_factor}개")
+    print(f"{'형식':<8}{'차원':>6}{'축소':>10}{'메모리(MB)':>12}{'검색 피크(MB)':>14}"
+          f"{'1차 recall':>12}{'재정렬 recall':>14}{'검색(ms)':>10}")
+    for dtype, reduced_dim, method, incremental in configs:
+        index = QuantizedIndex(dtype, reduced_dim, method)
+        recall_first, recall_rerank, nbytes, peak, latency = run(
+            index, corpus, queries, args.k, args.rerank_factor, incremental
+        )
+        dim = reduced_dim or EMBEDDING_DIM
+        label = (method + ("+add" if incremental else "")) if reduced_dim else "-"
+        print(f"{dtype:<8}{dim:>6}{label:>10}{nbytes / 1e6:>12.2f}{peak / 1e6:>14.2f}"
+              f"{recall_first:>12.3f}{recall_rerank:>14.3f}{latency:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
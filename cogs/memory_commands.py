@@ -4,6 +4,9 @@ import discord
 from memory_system.memory_manager import memory_manager
 from memory_system.schemas import MemoryChunk
 
+# !내기억 한 페이지에 표시할 기억 수
+MEMORY_PAGE_SIZE = 10
+
 
 class MemoryCommands(commands.Cog):
     """기억을 수동으로 관리하기 위한 명령어들을 포함하는 Cog"""
@@ -36,30 +39,94 @@ class MemoryCommands(commands.Cog):
     @commands.command(name="내기억")
     async def show_my_memories(self, ctx: commands.Context):
         """
-        봇이 자신에 대해 기억하고 있는 중요한 내용들을 보여줍니다.
+        봇이 자신에 대해 기억하고 있는 중요한 내용들을 최신순으로 보여줍니다.
         """
-        important_memories = memory_manager.vector_store.get_important_memories(user_id=ctx.author.id)
+        view = MemoryPageView(ctx.author)
+        embed = view.load_page()
 
-        if not important_memories:
+        if embed is None:
             await ctx.reply("아직 당신에 대해 기억하고 있는 특별한 내용이 없어요.")
             return
 
+        view.message = await ctx.send(embed=embed, view=view)
+
+
+class MemoryPageView(discord.ui.View):
+    """타임라인 인덱스의 키셋 커서로 중요 기억을 페이지 단위로 넘겨 보는 View"""
+
+    def __init__(self, author: discord.abc.User):
+        super().__init__(timeout=180)
+        self.author = author
+        self.total = memory_manager.vector_store.count_important_memories(author.id)
+        # 각 페이지의 시작 커서 (첫 페이지는 None), 이전 페이지로 돌아갈 때 사용
+        self.page_cursors = [None]
+        self.next_cursor = None
+        self.message: discord.Message | None = None
+
+    def load_page(self) -> discord.Embed | None:
+        """현재 페이지의 기억을 불러와 임베드를 만들고 버튼 상태를 갱신합니다."""
+        memories, self.next_cursor = memory_manager.vector_store.get_important_memories(
+            user_id=self.author.id, limit=MEMORY_PAGE_SIZE, before=self.page_cursors[-1]
+        )
+        if not memories:
+            return None
+
+        # 페이지 조회 중 ChromaDB에 없는 기억이 정리되었을 수 있으므로 매번 개수를 다시 읽음 (O(1))
+        self.total = memory_manager.vector_store.count_important_memories(self.author.id)
+        page = len(self.page_cursors)
+        total_pages = max(1, -(-self.total // MEMORY_PAGE_SIZE))
         embed = discord.Embed(
-            title=f"{ctx.author.name}님에 대한 중요 기억",
+            title=f"{self.author.name}님에 대한 중요 기억",
             color=discord.Color.blue()
         )
-
-        # 최신순으로 정렬하여 표시
-        important_memories.sort(key=lambda m: m.timestamp, reverse=True)
-
-        for mem in important_memories[:10]:  # 최대 10개까지 표시
+        for mem in memories:
             embed.add_field(
                 name=f"🗓️ {mem.timestamp.strftime('%Y-%m-%d')}",
                 value=f"```{mem.content}```",
                 inline=False
             )
+        embed.set_footer(text=f"{page}/{total_pages} 페이지 · 총 {self.total}개")
+
+        self.previous_page.disabled = page == 1
+        self.next_page.disabled = self.next_cursor is None
+        return embed
+
+    async def show_page(self, interaction: discord.Interaction):
+        """현재 페이지로 메시지를 수정합니다. 페이지가 비어 있으면 첫 페이지로 돌아갑니다."""
+        embed = self.load_page()
+        if embed is None and len(self.page_cursors) > 1:
+            # 타임라인의 기억이 ChromaDB에서 사라진 경우 등: 처음부터 다시 보여줌
+            self.page_cursors = [None]
+            embed = self.load_page()
+
+        if embed is None:
+            self.stop()
+            await interaction.response.edit_message(
+                content="아직 당신에 대해 기억하고 있는 특별한 내용이 없어요.", embed=None, view=None
+            )
+            return
+
+        await interaction.response.edit_message(embed=embed, view=self)
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        # 명령어를 실행한 사용자만 페이지를 넘길 수 있음
+        return interaction.user.id == self.author.id
+
+    @discord.ui.button(label="◀ 이전", style=discord.ButtonStyle.secondary)
+    async def previous_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if len(self.page_cursors) > 1:
+            self.page_cursors.pop()
+        await self.show_page(interaction)
+
+    @discord.ui.button(label="다음 ▶", style=discord.ButtonStyle.secondary)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if self.next_cursor is not None:
+            self.page_cursors.append(self.next_cursor)
+        await self.show_page(interaction)
 
-        await ctx.send(embed=embed)
+    async def on_timeout(self):
+        if self.message:
+            await self.message.edit(view=None)
 
 
 async def setup(bot: commands.Bot):
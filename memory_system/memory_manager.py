@@ -154,6 +154,10 @@ class MemoryManager:
 
         candidate_memories = self_memories + general_memories
 
+        # 최신성 신호: 타임라인 인덱스에서 사용자의 최근 기억 순위를 가져옴
+        recent_ids = self.vector_store.get_recent_memory_ids(user_id, n_results * 2)
+        recency_rank = {memory_id: rank for rank, memory_id in enumerate(recent_ids)}
+
         # 4단계: 증거 기반 점수 시스템
         scored_memories = []
         for mem in candidate_memories:
@@ -170,7 +174,11 @@ class MemoryManager:
             if query_entities and mem.entities and any(f",{entity}," in mem.entities for entity in query_entities):
                 score += 50
 
-            # 최신성 점수
+            # 최신성 점수 (+최대 10점): 사용자의 최근 기억일수록 높음
+            if mem.id in recency_rank:
+                score += 10 * (1 - recency_rank[mem.id] / len(recent_ids))
+
+            # 동점일 때는 더 최근 기억이 앞에 오도록
             score += mem.timestamp.timestamp() / 1e10
 
             if score > 0:
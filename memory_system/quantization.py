@@ -0,0 +1,217 @@
+import numpy as np
+from typing import List, Dict, Iterable, Tuple
+
+# 1차 검색용 인덱스가 지원하는 저장 형식
+INDEX_DTYPES = ("float32", "float16", "int8")
+# 차원 축소 방식: 'truncate'는 앞쪽 차원만 사용(Matryoshka 방식), 'pca'는 주성분 투영
+REDUCE_METHODS = ("truncate", "pca")
+# 검색 시 한 번에 float32로 변환해 계산할 행 수 (변환 버퍼 크기를 일정하게 유지)
+SEARCH_BLOCK_ROWS = 1024
+# PCA 학습에 사용할 최대 샘플 수 (이보다 많으면 무작위 추출, 이 크기로 학습한 뒤에는 재학습하지 않음)
+PCA_FIT_MAX_SAMPLES = 20000
+
+
+class QuantizedIndex:
+    """
+    임베딩을 int8/float16으로 양자화(및 선택적으로 차원 축소)하여 메모리에 보관하는
+    1차 검색용 인덱스입니다.
+    원본 float32 벡터는 ChromaDB에 그대로 남아 있으며, 상위 후보의 재정렬에만 사용됩니다.
+    """
+
+    def __init__(self, dtype: str = "int8", reduced_dim: int | None = None, reduce_method: str = "truncate"):
+        if dtype not in INDEX_DTYPES:
+            raise ValueError(f"지원하지 않는 인덱스 형식입니다: {dtype} (가능: {INDEX_DTYPES})")
+        if reduce_method not in REDUCE_METHODS:
+            raise ValueError(f"지원하지 않는 차원 축소 방식입니다: {reduce_method} (가능: {REDUCE_METHODS})")
+        if reduced_dim is not None and reduced_dim <= 0:
+            raise ValueError("reduced_dim은 양수여야 합니다.")
+
+        self.dtype = dtype
+        self.reduced_dim = reduced_dim
+        self.reduce_method = reduce_method
+
+        self.ids: List[str] = []
+        self._positions: Dict[str, int] = {}
+        self._codes: np.ndarray | None = None   # (n, d) 양자화된 벡터
+        self._scales: np.ndarray | None = None  # (n,) int8 역양자화 배율
+        self._sq_norms: np.ndarray | None = None  # (n,) 축소된 벡터의 제곱 노름
+
+        # PCA 투영에 필요한 평균과 주성분 (fit 전에는 None → 앞쪽 차원 절단으로 동작)
+        self._mean: np.ndarray | None = None
+        self._components: np.ndarray | None = None
+        # 주성분을 학습할 때 사용한 샘플 수 (인덱스가 이보다 두 배 커지면 재학습 필요)
+        self._fitted_size = 0
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def nbytes(self) -> int:
+        """인덱스가 차지하는 벡터 데이터의 바이트 수 (ID 문자열 제외)."""
+        total = 0
+        for arr in (self._codes, self._scales, self._sq_norms, self._mean, self._components):
+            if arr is not None:
+                total += arr.nbytes
+        return total
+
+    @property
+    def needs_fit(self) -> bool:
+        """PCA 방식이 요청되었지만 아직 주성분을 학습하지 못해 절단 방식으로 동작 중인지 여부."""
+        return self.reduce_method == "pca" and self.reduced_dim is not None and self._components is None
+
+    @property
+    def needs_refit(self) -> bool:
+        """
+        PCA를 (다시) 학습해야 하는지 여부.
+        처음 reduced_dim개가 모였을 때, 그리고 이후 학습 당시보다 인덱스가 두 배로 커질 때마다 True가 됩니다.
+        인덱스는 원본 벡터를 보관하지 않으므로, 소유자가 전체 원본 벡터로 build를 다시 호출해야 합니다.
+        """
+        if self.reduce_method != "pca" or self.reduced_dim is None:
+            return False
+        if self._components is None:
+            return len(self.ids) >= self.reduced_dim
+        return self._fitted_size < PCA_FIT_MAX_SAMPLES and len(self.ids) >= 2 * self._fitted_size
+
+    # --- 차원 축소 ---
+
+    def fit(self, vectors: np.ndarray):
+        """
+        PCA 방식일 때 주어진 벡터로 주성분을 학습합니다.
+        샘플 수가 목표 차원보다 적으면 학습하지 않고 절단 방식으로 동작합니다. (needs_refit 참고)
+        """
+        if self.reduce_method != "pca" or self.reduced_dim is None:
+            return
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if vectors.ndim != 2 or len(vectors) < self.reduced_dim:
+            return
+        if len(vectors) > PCA_FIT_MAX_SAMPLES:
+            sample = np.random.default_rng(0).choice(len(vectors), PCA_FIT_MAX_SAMPLES, replace=False)
+            vectors = vectors[sample]
+        mean = vectors.mean(axis=0)
+        # 공분산 대신 SVD를 사용해 상위 주성분을 구합니다.
+        _, _, vt = np.linalg.svd(vectors - mean, full_matrices=False)
+        self._mean = mean.astype(np.float32)
+        self._components = vt[:self.reduced_dim].astype(np.float32)
+        self._fitted_size = len(vectors)
+
+    def _reduce(self, vectors: np.ndarray) -> np.ndarray:
+        if self.reduced_dim is None:
+            return vectors
+        if self._components is not None:
+            return (vectors - self._mean) @ self._components.T
+        return vectors[:, :self.reduced_dim]
+
+    # --- 양자화 ---
+
+    def _encode(self, vectors: np.ndarray) -> Tuple[np.ndarray, np.ndarray | None]:
+        if self.dtype == "int8":
+            # 벡터별 대칭 양자화: 절댓값 최댓값을 127로 매핑
+            scales = np.abs(vectors).max(axis=1) / 127.0
+            scales[scales == 0] = 1.0
+            codes = np.clip(np.rint(vectors / scales[:, None]), -127, 127).astype(np.int8)
+            return codes, scales.astype(np.float32)
+        return vectors.astype(self.dtype), None
+
+    def _decode_sq_norms(self, codes: np.ndarray, scales: np.ndarray | None) -> np.ndarray:
+        approx = codes.astype(np.float32)
+        if scales is not None:
+            approx *= scales[:, None]
+        return np.einsum("ij,ij->i", approx, approx)
+
+    # --- 인덱스 조작 ---
+
+    def build(self, ids: List[str], vectors: Iterable[List[float]]):
+        """기존 인덱스를 버리고 주어진 벡터 전체로 다시 만듭니다. (PCA 방식이면 재학습 포함)"""
+        self.ids = []
+        self._positions = {}
+        self._codes = self._scales = self._sq_norms = None
+        matrix = np.asarray(list(vectors), dtype=np.float32)
+        if len(ids) == 0:
+            return
+        self.fit(matrix)
+        self._append(list(ids), matrix)
+
+    def add(self, ids: List[str], vectors: Iterable[List[float]]):
+        """새 벡터를 인덱스에 추가합니다. 이미 있는 ID는 새 값으로 교체됩니다."""
+        ids = list(ids)
+        matrix = np.asarray(list(vectors), dtype=np.float32)
+        if len(ids) == 0:
+            return
+        self.remove([i for i in ids if i in self._positions])
+        self._append(ids, matrix)
+
+    def _append(self, ids: List[str], matrix: np.ndarray):
+        codes, scales = self._encode(self._reduce(matrix))
+        sq_norms = self._decode_sq_norms(codes, scales)
+
+        start = len(self.ids)
+        self.ids.extend(ids)
+        for offset, memory_id in enumerate(ids):
+            self._positions[memory_id] = start + offset
+
+        if self._codes is None:
+            self._codes, self._scales, self._sq_norms = codes, scales, sq_norms
+        else:
+            self._codes = np.concatenate([self._codes, codes])
+            self._sq_norms = np.concatenate([self._sq_norms, sq_norms])
+            if scales is not None:
+                self._scales = np.concatenate([self._scales, scales])
+
+    def remove(self, ids: Iterable[str]):
+        """주어진 ID의 벡터를 인덱스에서 제거합니다."""
+        drop = [self._positions[i] for i in ids if i in self._positions]
+        if not drop:
+            return
+        keep = np.ones(len(self.ids), dtype=bool)
+        keep[drop] = False
+        self.ids = [memory_id for memory_id, k in zip(self.ids, keep) if k]
+        self._positions = {memory_id: pos for pos, memory_id in enumerate(self.ids)}
+        self._codes = self._codes[keep]
+        self._sq_norms = self._sq_norms[keep]
+        if self._scales is not None:
+            self._scales = self._scales[keep]
+
+    def search(self, query: List[float], k: int, allowed_ids: Iterable[str] | None = None) -> List[str]:
+        """
+        양자화된 벡터로 근사 제곱 L2 거리를 계산해 가장 가까운 후보 k개의 ID를 반환합니다.
+        allowed_ids가 주어지면 그 안에서만 검색합니다.
+        """
+        if not self.ids or k <= 0:
+            return []
+        q = self._reduce(np.asarray([query], dtype=np.float32))[0].astype(np.float32)
+
+        # 코드 전체를 한 번에 float32로 바꾸면 양자화로 줄인 메모리만큼 임시 복사본이 생기므로,
+        # 고정 크기 블록 단위로 변환하여 내적을 계산합니다.
+        dots = np.empty(len(self.ids), dtype=np.float32)
+        for start in range(0, len(self.ids), SEARCH_BLOCK_ROWS):
+            block = self._codes[start:start + SEARCH_BLOCK_ROWS]
+            np.dot(block.astype(np.float32, copy=False), q, out=dots[start:start + len(block)])
+        if self._scales is not None:
+            dots *= self._scales
+        distances = self._sq_norms - 2.0 * dots + float(q @ q)
+
+        if allowed_ids is not None:
+            mask = np.full(len(self.ids), np.inf, dtype=np.float32)
+            positions = [self._positions[i] for i in allowed_ids if i in self._positions]
+            if not positions:
+                return []
+            mask[positions] = 0.0
+            distances = distances + mask
+
+        k = min(k, int(np.isfinite(distances).sum()))
+        if k == 0:
+            return []
+        top = np.argpartition(distances, k - 1)[:k]
+        top = top[np.argsort(distances[top])]
+        return [self.ids[i] for i in top]
+
+
+def rerank_exact(query: List[float], ids: List[str], vectors: Iterable[List[float]], k: int) -> List[str]:
+    """원본 float32 벡터로 제곱 L2 거리를 다시 계산하여 상위 k개의 ID를 순서대로 반환합니다."""
+    if not ids:
+        return []
+    matrix = np.asarray(list(vectors), dtype=np.float32)
+    q = np.asarray(query, dtype=np.float32)
+    distances = ((matrix - q) ** 2).sum(axis=1)
+    order = np.argsort(distances)[:k]
+    return [ids[i] for i in order]
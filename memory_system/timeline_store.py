@@ -0,0 +1,163 @@
+import sqlite3
+from datetime import datetime
+from typing import List, Tuple, Iterable, Set
+
+from memory_system.schemas import MemoryChunk
+
+# 타임라인 인덱스 파일 경로 (ChromaDB와 같은 data 폴더 사용)
+TIMELINE_DB_PATH = "./data/timeline.sqlite3"
+
+# 키셋 페이지네이션 커서: (timestamp, id) — 이 값보다 오래된 항목부터 이어서 조회합니다.
+Cursor = Tuple[float, str]
+
+
+class TimelineStore:
+    """
+    사용자별 기억 타임라인을 위한 SQLite 보조 인덱스입니다.
+    (user_id, is_important, timestamp) 인덱스로 최신순 조회와 키셋 페이지네이션을,
+    별도의 카운트 테이블로 개수 조회를 O(log n)에 처리합니다.
+    기억 내용 자체는 저장하지 않으며, ID로 ChromaDB에서 가져옵니다.
+    """
+
+    def __init__(self, db_path: str = TIMELINE_DB_PATH):
+        self.conn = sqlite3.connect(db_path)
+        self.conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS timeline (
+                id TEXT PRIMARY KEY,
+                user_id INTEGER NOT NULL,
+                is_important INTEGER NOT NULL,
+                timestamp REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_timeline_user
+                ON timeline (user_id, is_important, timestamp, id);
+            CREATE INDEX IF NOT EXISTS idx_timeline_user_all
+                ON timeline (user_id, timestamp, id);
+            CREATE INDEX IF NOT EXISTS idx_timeline_important
+                ON timeline (is_important, timestamp, id);
+            CREATE TABLE IF NOT EXISTS timeline_counts (
+                user_id INTEGER NOT NULL,
+                is_important INTEGER NOT NULL,
+                count INTEGER NOT NULL,
+                PRIMARY KEY (user_id, is_important)
+            );
+            """
+        )
+        self.conn.commit()
+
+    @staticmethod
+    def _to_epoch(timestamp: datetime) -> float:
+        # retrieve_relevant_memories의 최신성 점수와 같은 기준(datetime.timestamp())을 사용합니다.
+        return timestamp.timestamp()
+
+    def _adjust_count(self, user_id: int, is_important: int, delta: int):
+        self.conn.execute(
+            """
+            INSERT INTO timeline_counts (user_id, is_important, count) VALUES (?, ?, ?)
+            ON CONFLICT (user_id, is_important) DO UPDATE SET count = count + excluded.count
+            """,
+            (user_id, is_important, delta)
+        )
+
+    def _upsert(self, chunk: MemoryChunk):
+        previous = self.conn.execute(
+            "SELECT user_id, is_important FROM timeline WHERE id = ?", (chunk.id,)
+        ).fetchone()
+        if previous:
+            self._adjust_count(previous[0], previous[1], -1)
+
+        is_important = int(chunk.is_important)
+        self.conn.execute(
+            "INSERT OR REPLACE INTO timeline (id, user_id, is_important, timestamp) VALUES (?, ?, ?, ?)",
+            (chunk.id, chunk.user_id, is_important, self._to_epoch(chunk.timestamp))
+        )
+        self._adjust_count(chunk.user_id, is_important, 1)
+
+    def add(self, chunk: MemoryChunk):
+        """기억 하나를 타임라인에 추가합니다. 같은 ID가 있으면 교체합니다."""
+        with self.conn:
+            self._upsert(chunk)
+
+    def remove(self, ids: Iterable[str]):
+        """주어진 ID의 기억을 타임라인에서 제거하고 카운트를 갱신합니다."""
+        with self.conn:
+            for memory_id in ids:
+                previous = self.conn.execute(
+                    "SELECT user_id, is_important FROM timeline WHERE id = ?", (memory_id,)
+                ).fetchone()
+                if previous:
+                    self.conn.execute("DELETE FROM timeline WHERE id = ?", (memory_id,))
+                    self._adjust_count(previous[0], previous[1], -1)
+
+    def rebuild(self, chunks: Iterable[MemoryChunk]):
+        """타임라인 전체를 주어진 기억들로 다시 만듭니다. (ChromaDB와 동기화할 때 사용)"""
+        with self.conn:
+            self.conn.execute("DELETE FROM timeline")
+            self.conn.execute("DELETE FROM timeline_counts")
+            for chunk in chunks:
+                self._upsert(chunk)
+
+    def total(self) -> int:
+        """타임라인에 등록된 전체 기억 수."""
+        row = self.conn.execute("SELECT COALESCE(SUM(count), 0) FROM timeline_counts").fetchone()
+        return row[0]
+
+    def all_ids(self) -> Set[str]:
+        """타임라인에 등록된 모든 기억 ID. (ChromaDB와 동기화 여부를 확인할 때 사용)"""
+        return {row[0] for row in self.conn.execute("SELECT id FROM timeline")}
+
+    def count(self, user_id: int, important_only: bool = False) -> int:
+        """사용자의 기억 수 (important_only=True이면 중요 기억만)."""
+        if important_only:
+            row = self.conn.execute(
+                "SELECT count FROM timeline_counts WHERE user_id = ? AND is_important = 1", (user_id,)
+            ).fetchone()
+        else:
+            row = self.conn.execute(
+                "SELECT COALESCE(SUM(count), 0) FROM timeline_counts WHERE user_id = ?", (user_id,)
+            ).fetchone()
+        return row[0] if row else 0
+
+    def page(
+            self,
+            user_id: int | None,
+            important_only: bool = True,
+            limit: int = 10,
+            before: Cursor | None = None
+    ) -> Tuple[List[str], Cursor | None]:
+        """
+        최신순으로 기억 ID 한 페이지와 다음 페이지 커서를 반환합니다.
+        before 커서가 주어지면 그보다 오래된 기억부터 가져옵니다. 마지막 페이지면 커서는 None입니다.
+        user_id가 None이면 전체 사용자의 중요 기억을 대상으로 합니다.
+        """
+        if limit <= 0:
+            return [], None
+
+        conditions, params = [], []
+        if user_id is not None:
+            conditions.append("user_id = ?")
+            params.append(user_id)
+        if important_only or user_id is None:
+            conditions.append("is_important = 1")
+        if before is not None:
+            conditions.append("(timestamp, id) < (?, ?)")
+            params.extend(before)
+
+        # 다음 페이지 존재 여부를 알기 위해 하나 더 가져옵니다.
+        rows = self.conn.execute(
+            f"SELECT id, timestamp FROM timeline WHERE {' AND '.join(conditions)} "
+            f"ORDER BY timestamp DESC, id DESC LIMIT ?",
+            (*params, limit + 1)
+        ).fetchall()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            if rows:
+                next_cursor = (rows[-1][1], rows[-1][0])
+        return [row[0] for row in rows], next_cursor
+
+    def most_recent(self, user_id: int, n: int, important_only: bool = False) -> List[str]:
+        """사용자의 가장 최근 기억 n개의 ID를 최신순으로 반환합니다."""
+        ids, _ = self.page(user_id, important_only=important_only, limit=n)
+        return ids
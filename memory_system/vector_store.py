@@ -1,23 +1,79 @@
 import chromadb
 from chromadb.types import Where
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple, Set
 
 from memory_system.schemas import MemoryChunk
+from memory_system.quantization import QuantizedIndex, INDEX_DTYPES, rerank_exact
+from memory_system.timeline_store import TimelineStore, Cursor
 
 # 데이터베이스 파일이 저장될 경로
 DB_PATH = "./data/chroma_db"
 COLLECTION_NAME = "memory_collection"
+# 양자화 인덱스에서 재정렬할 후보 수 = n_results * RERANK_FACTOR
+RERANK_FACTOR = 4
 
 
 class VectorStore:
     """
     벡터 데이터베이스(ChromaDB)와의 상호작용을 관리하는 클래스입니다.
     메모리 추가, 검색 등의 기능을 추상화하여 제공합니다.
+
+    index_dtype이 'float16' 또는 'int8'이면 양자화된 벡터(선택적으로 reduced_dim 차원으로 축소)를
+    메모리에 따로 두고 1차 검색에 사용하며, ChromaDB의 원본 float32 벡터는 상위 후보의 재정렬에만 씁니다.
+    기본값 'float32'는 기존처럼 ChromaDB 검색을 그대로 사용합니다.
+    ChromaDB는 이 모드에서도 자체 float32 HNSW 인덱스를 유지하므로 ChromaDB의 상주 메모리는 줄지 않으며,
+    양자화 인덱스는 그 위에 추가로 올라갑니다. 이 모드가 줄이는 것은 1차 점수 계산의 비용입니다.
     """
 
-    def __init__(self):
+    def __init__(
+            self,
+            index_dtype: str = "float32",
+            reduced_dim: int | None = None,
+            reduce_method: str = "truncate",
+            rerank_factor: int = RERANK_FACTOR
+    ):
+        if index_dtype not in INDEX_DTYPES:
+            raise ValueError(f"지원하지 않는 인덱스 형식입니다: {index_dtype} (가능: {INDEX_DTYPES})")
+
         self.client = chromadb.PersistentClient(path=DB_PATH)
         self.collection = self.client.get_or_create_collection(name=COLLECTION_NAME)
+        self.rerank_factor = max(1, rerank_factor)
+
+        # 사용자별 최신순 조회를 위한 SQLite 보조 인덱스
+        self.timeline = TimelineStore()
+        self.sync_timeline()
+
+        self.quantized_index: QuantizedIndex | None = None
+        # 양자화 모드에서 author_name 필터를 ChromaDB 메타데이터 조회 없이 처리하기 위한 작성자별 ID 목록
+        self._ids_by_author: Dict[str, Set[str]] = {}
+        if index_dtype != "float32" or reduced_dim is not None:
+            self.quantized_index = QuantizedIndex(index_dtype, reduced_dim, reduce_method)
+            self.rebuild_quantized_index()
+
+    def rebuild_quantized_index(self):
+        """ChromaDB에 저장된 원본 벡터 전체로 양자화 인덱스를 다시 만듭니다. (PCA 재학습 포함)"""
+        if self.quantized_index is None:
+            return
+        results = self.collection.get(include=["embeddings", "metadatas"])
+        self.quantized_index.build(results.get('ids', []), results.get('embeddings', []))
+
+        self._ids_by_author = {}
+        for memory_id, meta in zip(results.get('ids', []), results.get('metadatas', [])):
+            self._ids_by_author.setdefault(meta.get('author_name'), set()).add(memory_id)
+        print(f"✅ 양자화 인덱스를 구성했습니다: {len(self.quantized_index)}개, {self.quantized_index.nbytes} bytes")
+        if self.quantized_index.needs_fit:
+            print(f"⚠️ PCA 학습에 필요한 벡터가 부족합니다 ({len(self.quantized_index)}/{self.quantized_index.reduced_dim}). "
+                  f"충분히 쌓일 때까지 앞쪽 {self.quantized_index.reduced_dim}차원 절단 방식으로 검색합니다.")
+
+    def sync_timeline(self):
+        """타임라인 인덱스의 기억 ID 집합이 ChromaDB와 다르면 ChromaDB 메타데이터로 다시 만듭니다."""
+        # 개수만 비교하면 DB가 같은 개수의 다른 기억으로 교체된 경우를 놓치므로 ID 집합을 비교합니다.
+        chroma_ids = set(self.collection.get(include=[]).get('ids', []))
+        if self.timeline.all_ids() == chroma_ids:
+            return
+        results = self.collection.get(include=["metadatas"])
+        self.timeline.rebuild(MemoryChunk(**meta) for meta in results.get('metadatas', []))
+        print(f"✅ 타임라인 인덱스를 ChromaDB와 동기화했습니다: {self.timeline.total()}개")
 
     def _chunk_to_metadata(self, chunk: MemoryChunk) -> Dict[str, Any]:
         """MemoryChunk 객체를 ChromaDB의 메타데이터 형식(dict)으로 변환합니다."""
@@ -42,6 +98,13 @@ class VectorStore:
             metadatas=[self._chunk_to_metadata(chunk)],
             documents=[chunk.content]
         )
+        self.timeline.add(chunk)
+        if self.quantized_index is not None:
+            self.quantized_index.add([chunk.id], [embedding])
+            self._ids_by_author.setdefault(chunk.author_name, set()).add(chunk.id)
+            # PCA 모드: 학습 당시보다 기억이 충분히 늘었으면 ChromaDB의 원본 벡터로 다시 학습
+            if self.quantized_index.needs_refit:
+                self.rebuild_quantized_index()
         print(f"✅ 기억이 추가되었습니다: (ID: {chunk.id})")
 
     def search_memories(
@@ -53,6 +116,9 @@ class VectorStore:
         """
         주어진 쿼리 임베딩과 가장 유사한 기억들을 검색합니다.
         """
+        if self.quantized_index is not None:
+            return self._search_quantized(query_embedding, n_results, filter_where)
+
         query_args = {
             'query_embeddings': [query_embedding],
             'n_results': n_results
@@ -66,15 +132,81 @@ class VectorStore:
         retrieved_metadatas = query_result.get('metadatas', [[]])[0]
         return [MemoryChunk(**meta) for meta in retrieved_metadatas]
 
-    def get_important_memories(self, user_id: int | None = None) -> List[MemoryChunk]:
+    def _search_quantized(
+            self,
+            query_embedding: List[float],
+            n_results: int,
+            filter_where: Where | None
+    ) -> List[MemoryChunk]:
+        """양자화 인덱스로 후보를 고른 뒤, 원본 float32 벡터로 재정렬합니다."""
+        allowed_ids = self._resolve_filter_ids(filter_where)
+
+        candidate_ids = self.quantized_index.search(
+            query_embedding, n_results * self.rerank_factor, allowed_ids=allowed_ids
+        )
+        if not candidate_ids:
+            return []
+
+        candidates = self.collection.get(ids=candidate_ids, include=["embeddings", "metadatas"])
+        ids = candidates.get('ids', [])
+        metadatas_by_id = dict(zip(ids, candidates.get('metadatas', [])))
+
+        ranked_ids = rerank_exact(query_embedding, ids, candidates.get('embeddings', []), n_results)
+        return [MemoryChunk(**metadatas_by_id[memory_id]) for memory_id in ranked_ids]
+
+    def _resolve_filter_ids(self, filter_where: Where | None) -> Set[str] | List[str] | None:
+        """
+        양자화 검색에서 필터를 만족하는 ID 목록을 구합니다.
+        {"author_name": 이름} 형태는 로컬 목록으로 처리하고, 그 밖의 필터는 ChromaDB 메타데이터를 조회합니다.
+        """
+        if not filter_where:
+            return None
+        if list(filter_where) == ["author_name"]:
+            author_name = filter_where["author_name"]
+            if isinstance(author_name, dict) and list(author_name) == ["$eq"]:
+                author_name = author_name["$eq"]
+            if isinstance(author_name, str):
+                return self._ids_by_author.get(author_name, set())
+        return self.collection.get(where=filter_where, include=[]).get('ids', [])
+
+    def get_memories_by_ids(self, ids: List[str]) -> List[MemoryChunk]:
         """
-        (현재 사용 안 함) 'is_important' 플래그가 True인 모든 중요 기억을 가져옵니다.
+        ID 목록에 해당하는 기억들을 주어진 순서대로 가져옵니다.
+        ChromaDB에 없는 ID는 타임라인 인덱스에서도 제거하여 개수와 페이지가 어긋나지 않게 합니다.
         """
-        where_filter: Where = {"is_important": True}
-        if user_id:
-            where_filter = {"$and": [{"is_important": True}, {"user_id": user_id}]}
+        if not ids:
+            return []
+        results = self.collection.get(ids=ids, include=["metadatas"])
+        metadatas_by_id = dict(zip(results.get('ids', []), results.get('metadatas', [])))
 
-        results = self.collection.get(where=where_filter, limit=100)  # get에는 limit 사용
+        missing_ids = [memory_id for memory_id in ids if memory_id not in metadatas_by_id]
+        if missing_ids:
+            print(f"⚠️ 타임라인 인덱스의 기억 {len(missing_ids)}개가 ChromaDB에 없어 제거합니다: {missing_ids}")
+            self.timeline.remove(missing_ids)
 
-        retrieved_metadatas = results.get('metadatas', [])
-        return [MemoryChunk(**meta) for meta in retrieved_metadatas]
\ No newline at end of file
+        return [MemoryChunk(**metadatas_by_id[memory_id]) for memory_id in ids if memory_id in metadatas_by_id]
+
+    def get_important_memories(
+            self,
+            user_id: int | None = None,
+            limit: int = 10,
+            before: Cursor | None = None
+    ) -> Tuple[List[MemoryChunk], Cursor | None]:
+        """
+        'is_important' 플래그가 True인 중요 기억을 최신순으로 한 페이지 가져옵니다.
+        타임라인 인덱스를 사용하며, 다음 페이지를 위한 커서(마지막 페이지면 None)를 함께 반환합니다.
+        """
+        while True:
+            ids, next_cursor = self.timeline.page(user_id, important_only=True, limit=limit, before=before)
+            memories = self.get_memories_by_ids(ids)
+            # ChromaDB에 없던 ID는 방금 타임라인에서 제거되었으므로, 같은 페이지를 다시 조회해 빈 자리를 채움
+            if len(memories) == len(ids):
+                return memories, next_cursor
+
+    def count_important_memories(self, user_id: int) -> int:
+        """사용자의 중요 기억 수를 반환합니다."""
+        return self.timeline.count(user_id, important_only=True)
+
+    def get_recent_memory_ids(self, user_id: int, n: int) -> List[str]:
+        """사용자의 가장 최근 기억 n개의 ID를 최신순으로 반환합니다."""
+        return self.timeline.most_recent(user_id, n)